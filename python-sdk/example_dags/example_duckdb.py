@@ -30,6 +30,8 @@ def sql_duck_func(python_1: Table):
 @dag(
     schedule_interval="0 0 * * * *",
     start_date=pendulum.from_format("2023-02-23", "YYYY-MM-DD").in_tz("UTC"),
+    max_active_runs=1,
+    catchup=False,
 )
 def pipeline_2():
     python_1 = python_1_func()
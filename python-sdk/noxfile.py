@@ -8,6 +8,15 @@ nox.options.sessions = ["dev"]
 nox.options.reuse_existing_virtualenvs = True
 
 
+def _log_installed_dependencies(session: nox.Session) -> None:
+    """Log all the packages installed in the session virtualenv."""
+    session.log("Installed Dependencies:")
+    if session.venv_backend == "uv":
+        session.run("uv", "pip", "freeze", external=True)
+    else:
+        session.run("pip3", "freeze")
+
+
 @nox.session(python="3.10")
 def dev(session: nox.Session) -> None:
     """Create a dev environment with everything installed.
@@ -19,7 +28,8 @@ def dev(session: nox.Session) -> None:
     session.install("-e", ".[all,tests]")
 
 
-@nox.session(python=["3.8", "3.9", "3.10", "3.11"])
+# The test sessions resolve and install with uv when it is available, falling back to pip otherwise.
+@nox.session(python=["3.8", "3.9", "3.10", "3.11"], venv_backend="uv|virtualenv")
 @nox.parametrize("airflow", ["2.7", "2.8"])
 def test(session: nox.Session, airflow) -> None:
     """Run both unit and integration tests."""
@@ -28,12 +38,9 @@ def test(session: nox.Session, airflow) -> None:
         "AIRFLOW__CORE__ALLOWED_DESERIALIZATION_CLASSES": "airflow.* astro.*",
     }
 
-    session.install(f"apache-airflow~={airflow}")
-    session.install("-e", ".[all,tests]")
+    session.install(f"apache-airflow~={airflow}", "-e", ".[all,tests]")
 
-    # Log all the installed dependencies
-    session.log("Installed Dependencies:")
-    session.run("pip3", "freeze")
+    _log_installed_dependencies(session)
 
     session.run("airflow", "db", "init", env=env)
 
@@ -55,7 +62,7 @@ def type_check(session: nox.Session) -> None:
     session.run("mypy")
 
 
-@nox.session()
+@nox.session(venv_backend="uv|virtualenv")
 @nox.parametrize(
     "extras",
     [
@@ -76,12 +83,9 @@ def test_examples_by_dependency(session: nox.Session, extras):
         "AIRFLOW__CORE__ALLOWED_DESERIALIZATION_CLASSES": "airflow.* astro.*",
     }
 
-    session.install("-e", f".[{pypi_deps}]")
-    session.install("-e", ".[tests]")
+    session.install("-e", f".[{pypi_deps},tests]")
 
-    # Log all the installed dependencies
-    session.log("Installed Dependencies:")
-    session.run("pip3", "freeze")
+    _log_installed_dependencies(session)
 
     session.run("airflow", "db", "init", env=env)
 
@@ -1,22 +1,25 @@
+import functools
 import logging
 import os
+import subprocess
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, List
+from typing import Any, Dict, List, Optional, Tuple
 
-from airflow import DAG, settings
+import boto3
+from airflow import DAG
+from airflow.exceptions import AirflowException
 from airflow.models import Connection, DagRun
-from airflow.models.baseoperator import chain
-from airflow.operators.bash import BashOperator
+from airflow.models.taskinstance import TaskInstance
+from airflow.models.xcom import XCom
 from airflow.operators.dummy import DummyOperator
 from airflow.operators.python import PythonOperator, get_current_context
 from airflow.operators.trigger_dagrun import TriggerDagRunOperator
 from airflow.providers.slack.operators.slack_webhook import SlackWebhookOperator
 from airflow.utils.session import create_session
-
-if TYPE_CHECKING:
-    from airflow.models.taskinstance import TaskInstance
-
+from sqlalchemy import and_, or_
 
 SLACK_CHANNEL = os.getenv("SLACK_CHANNEL", "#provider-alert")
 SLACK_WEBHOOK_CONN = os.getenv("SLACK_WEBHOOK_CONN", "http_slack")
@@ -34,29 +37,75 @@ SFTP_USERNAME = os.getenv("SFTP_USERNAME", "not_set")
 SFTP_PASSWORD = os.getenv("SFTP_PASSWORD", "not_set")
 FTP_USERNAME = os.getenv("FTP_USERNAME", "not_set")
 FTP_PASSWORD = os.getenv("FTP_PASSWORD", "not_set")
+REPORT_IGNORED_TASK_IDS = ["end", "get_report"]
+STATE_EMOJI = {"failed": ":red_circle: ", "upstream_failed": ":large_orange_circle: "}
+ENV_DETAILS_COMMANDS = {
+    "airflow_version": "airflow version",
+    "airflow_executor": "airflow config get-value core executor",
+    "astro_sdk_version": "pip show astro-sdk-python | grep -i version | awk '{print $2}'",
+    "astro_cloud_provider": (
+        "[[ $AIRFLOW__LOGGING__REMOTE_LOG_CONN_ID == *azure* ]] && echo 'azure' ||"
+        "([[ $AIRFLOW__LOGGING__REMOTE_LOG_CONN_ID == *s3* ]] && echo 'aws' ||"
+        "([[ $AIRFLOW__LOGGING__REMOTE_LOG_CONN_ID == *gcs* ]] && echo 'gcs' ||"
+        "echo 'unknown'))"
+    ),
+}
 
 
 def get_report(dag_run_ids: List[str], **context: Any) -> None:  # noqa: C901
     """Fetch dags run details and generate report"""
 
     with create_session() as session:
-        last_dags_runs: List[DagRun] = session.query(DagRun).filter(DagRun.run_id.in_(dag_run_ids)).all()
+        dag_run = context["dag_run"]
+        last_dags_runs = (
+            session.query(DagRun.dag_id, DagRun.run_id, DagRun.state)
+            .filter(DagRun.run_id.in_(dag_run_ids))
+            .all()
+        )
+        # A successful dag run has no failure details to report, so its task instances are never looked at.
+        unsuccessful_dags_runs = [dr for dr in last_dags_runs if dr.state != "success"]
+        # Fetch the unsuccessful task instances of the triggered dag runs and the failed task instances of
+        # the master dag run in one query.
+        ti_by_run: Dict[Tuple[str, str], List[Any]] = defaultdict(list)
+        for ti in session.query(
+            TaskInstance.dag_id, TaskInstance.run_id, TaskInstance.task_id, TaskInstance.state
+        ).filter(
+            or_(
+                and_(
+                    TaskInstance.run_id.in_([dr.run_id for dr in unsuccessful_dags_runs]),
+                    TaskInstance.task_id.notin_(REPORT_IGNORED_TASK_IDS),
+                    or_(TaskInstance.state.is_(None), TaskInstance.state != "success"),
+                ),
+                and_(
+                    TaskInstance.dag_id == dag_run.dag_id,
+                    TaskInstance.run_id == dag_run.run_id,
+                    TaskInstance.state == "failed",
+                ),
+            )
+        ):
+            ti_by_run[(ti.dag_id, ti.run_id)].append(ti)
         message_list: List[str] = []
 
-        airflow_version = context["ti"].xcom_pull(task_ids="get_airflow_version")
-        airflow_executor = context["ti"].xcom_pull(task_ids="get_airflow_executor")
-        astro_sdk_version = context["ti"].xcom_pull(task_ids="get_astro_sdk_version")
-        astro_cloud_provider = context["ti"].xcom_pull(task_ids="get_astro_cloud_provider")
+        # Pull the environment details pushed by the `collect_env` task in one query
+        xcoms = {
+            xcom.key: XCom.deserialize_value(xcom)
+            for xcom in XCom.get_many(
+                run_id=dag_run.run_id,
+                task_ids="collect_env",
+                dag_ids=dag_run.dag_id,
+                session=session,
+            )
+        }
 
         report_details = [
             f"*{header}:* `{value}`\n"
             for header, value in [
                 ("Runtime version", os.getenv("ASTRONOMER_RUNTIME_VERSION", "N/A")),
                 ("Python version", os.getenv("PYTHON_VERSION", "N/A")),
-                ("Airflow version", airflow_version),
-                ("Executor", airflow_executor),
-                ("Astro-SDK version", astro_sdk_version),
-                ("Cloud provider", astro_cloud_provider),
+                ("Airflow version", xcoms.get("airflow_version")),
+                ("Executor", xcoms.get("airflow_executor")),
+                ("Astro-SDK version", xcoms.get("astro_sdk_version")),
+                ("Cloud provider", xcoms.get("astro_cloud_provider")),
             ]
         ]
 
@@ -70,26 +119,14 @@ def get_report(dag_run_ids: List[str], **context: Any) -> None:  # noqa: C901
             f"\n <{master_dag_deployment_link}|Link> to the master DAG deployment of the above run \n"
         )
 
-        dag_count, failed_dag_count = 0, 0
-        for dr in last_dags_runs:
-            dr_status = f" *{dr.dag_id} : {dr.get_state()}* \n"
-            dag_count += 1
-            failed_tasks = []
-            for ti in dr.get_task_instances():
-                task_code = ":black_circle: "
-                if not ((ti.task_id == "end") or (ti.task_id == "get_report")):
-                    if ti.state == "success":
-                        continue
-                    elif ti.state == "failed":
-                        task_code = ":red_circle: "
-                        failed_tasks.append(f"{task_code} {ti.task_id} : {ti.state} \n")
-                    elif ti.state == "upstream_failed":
-                        task_code = ":large_orange_circle: "
-                        failed_tasks.append(f"{task_code} {ti.task_id} : {ti.state} \n")
-                    else:
-                        failed_tasks.append(f"{task_code} {ti.task_id} : {ti.state} \n")
+        dag_count, failed_dag_count = len(last_dags_runs), 0
+        for dr in unsuccessful_dags_runs:
+            failed_tasks = [
+                f"{STATE_EMOJI.get(ti.state, ':black_circle: ')} {ti.task_id} : {ti.state} \n"
+                for ti in ti_by_run[(dr.dag_id, dr.run_id)]
+            ]
             if failed_tasks:
-                message_list.append(dr_status)
+                message_list.append(f" *{dr.dag_id} : {dr.state}* \n")
                 message_list.extend(failed_tasks)
                 failed_dag_count += 1
 
@@ -102,11 +139,9 @@ def get_report(dag_run_ids: List[str], **context: Any) -> None:  # noqa: C901
         if failed_dag_count > 0:
             output_list.append("*Failure Details:* \n")
             output_list.extend(message_list)
-        dag_run = context["dag_run"]
-        task_instances = dag_run.get_task_instances()
 
         task_failure_message_list: List[str] = [
-            f":red_circle: {ti.task_id} \n" for ti in task_instances if ti.state == "failed"
+            f":red_circle: {ti.task_id} \n" for ti in ti_by_run[(dag_run.dag_id, dag_run.run_id)]
         ]
 
         if task_failure_message_list:
@@ -115,13 +150,14 @@ def get_report(dag_run_ids: List[str], **context: Any) -> None:  # noqa: C901
             )
             output_list.extend(task_failure_message_list)
         output_list.append(deployment_message)
-        logging.info("%s", "".join(output_list))
+        report_message = "".join(output_list)
+        logging.info("%s", report_message)
         # Send dag run report on Slack
         try:
             SlackWebhookOperator(
                 task_id="slack_alert",
                 slack_webhook_conn_id=SLACK_WEBHOOK_CONN,
-                message="".join(output_list),
+                message=report_message,
                 channel=SLACK_CHANNEL,
                 username=SLACK_USERNAME,
             ).execute(context=None)
@@ -130,19 +166,53 @@ def get_report(dag_run_ids: List[str], **context: Any) -> None:  # noqa: C901
             raise exception
 
 
+def _run_bash_command(bash_command: str) -> Optional[str]:
+    """Run a bash command and return its output, or log it and return None if it failed"""
+    try:
+        return subprocess.run(["bash", "-c", bash_command], capture_output=True, text=True, check=True).stdout
+    except subprocess.CalledProcessError as error:
+        logging.error(
+            "Command `%s` failed with exit status %s.\nstdout:\n%s\nstderr:\n%s",
+            bash_command,
+            error.returncode,
+            error.stdout,
+            error.stderr,
+        )
+        return None
+
+
+def collect_env(ti: TaskInstance) -> None:
+    """
+    Run the environment metadata commands concurrently, log the installed pip packages and push the
+    last output line of every other command as an XCom keyed like `ENV_DETAILS_COMMANDS`.
+    The outputs of the successful commands are pushed before failing the task if any command failed.
+    """
+    commands = {"pip_packages": "pip freeze", **ENV_DETAILS_COMMANDS}
+    with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+        outputs = dict(zip(commands, executor.map(_run_bash_command, commands.values())))
+    failed_commands = [key for key, output in outputs.items() if output is None]
+    pip_packages = outputs.pop("pip_packages")
+    if pip_packages is not None:
+        logging.info("Installed pip packages:\n%s", pip_packages)
+    for key, output in outputs.items():
+        if output is not None:
+            lines = output.strip().splitlines()
+            ti.xcom_push(key=key, value=lines[-1] if lines else "")
+    if failed_commands:
+        raise AirflowException(f"Failed to collect the environment details: {', '.join(failed_commands)}")
+
+
 def prepare_dag_dependency(task_info, execution_time):
-    """Prepare list of TriggerDagRunOperator task and dags run ids for dags of same providers"""
+    """Prepare list of TriggerDagRunOperator task and dags run ids for (task_id, dag_id) pairs of same providers"""
     _dag_run_ids = []
     _task_list = []
-    for _example_dag in task_info:
-        _task_id = list(_example_dag.keys())[0]
-
-        _run_id = f"{_task_id}_{_example_dag.get(_task_id)}_" + execution_time
+    for _task_id, _dag_id in task_info:
+        _run_id = f"{_task_id}_{_dag_id}_" + execution_time
         _dag_run_ids.append(_run_id)
         _task_list.append(
             TriggerDagRunOperator(
                 task_id=_task_id,
-                trigger_dag_id=_example_dag.get(_task_id),
+                trigger_dag_id=_dag_id,
                 trigger_run_id=_run_id,
                 wait_for_completion=True,
                 reset_dag_run=True,
@@ -153,11 +223,19 @@ def prepare_dag_dependency(task_info, execution_time):
     return _task_list, _dag_run_ids
 
 
-def start_sftp_ftp_services_method():
-    import boto3
+@functools.lru_cache(maxsize=None)
+def _ec2_resource():
+    """Return the EC2 resource, created once per process and shared by all the EC2 calls"""
+    return boto3.resource("ec2", **AWS_S3_CREDS)
+
+
+def _ec2_client():
+    """Return the low-level client of the shared EC2 resource"""
+    return _ec2_resource().meta.client
 
-    ec2 = boto3.resource("ec2", **AWS_S3_CREDS)
-    instance = ec2.create_instances(
+
+def start_sftp_ftp_services_method():
+    instance = _ec2_resource().create_instances(
         ImageId=AMI_ID,
         MinCount=1,
         MaxCount=1,
@@ -168,20 +246,19 @@ def start_sftp_ftp_services_method():
     instance_id = instance[0].instance_id
     ti = get_current_context()["ti"]
     ti.xcom_push(key=EC2_INSTANCE_ID_KEY, value=instance_id)
-    time.sleep(
-        120
-    )  # Need to wait for ecs instance to be up otherwise the `boto3's describe_instances` call fails.
-    while get_instances_status(instance_id) != "running":
-        logging.info("Waiting for Instance to be available in running state. Sleeping for 30 seconds.")
-        time.sleep(30)
+    # `running` only means the VM was started, the SFTP/FTP services are reachable once the instance passed
+    # its reachability checks. The waiter retries while the new instance id is not yet known to EC2, so
+    # there is no need to sleep for a fixed time before polling.
+    logging.info("Waiting for Instance to pass its status checks.")
+    _ec2_client().get_waiter("instance_status_ok").wait(
+        InstanceIds=[instance_id], WaiterConfig={"Delay": 10, "MaxAttempts": 60}
+    )
+    get_instances_status(instance_id)  # pushes the public IP of the running instance
 
 
 def get_instances_status(instance_id: str) -> str:
     """Get the instance status by id"""
-    import boto3
-
-    client = boto3.client("ec2", **AWS_S3_CREDS)
-    response = client.describe_instances(
+    response = _ec2_client().describe_instances(
         InstanceIds=[instance_id],
     )
     print("response : ", response)
@@ -199,10 +276,11 @@ def create_sftp_ftp_airflow_connection(task_instance: Any) -> None:
     Checks if airflow connection exists, if yes then deletes it.
     Then, create a new sftp_default, ftp_default connection.
     """
+    public_ip = task_instance.xcom_pull(key=INSTANCE_PUBLIC_IP, task_ids=["start_sftp_ftp_services"])[0]
     sftp_conn = Connection(
         conn_id="sftp_conn",
         conn_type="sftp",
-        host=task_instance.xcom_pull(key=INSTANCE_PUBLIC_IP, task_ids=["start_sftp_ftp_services"])[0],
+        host=public_ip,
         login=SFTP_USERNAME,
         password=SFTP_PASSWORD,
     )  # create a connection object
@@ -210,35 +288,29 @@ def create_sftp_ftp_airflow_connection(task_instance: Any) -> None:
     ftp_conn = Connection(
         conn_id="ftp_conn",
         conn_type="ftp",
-        host=task_instance.xcom_pull(key=INSTANCE_PUBLIC_IP, task_ids=["start_sftp_ftp_services"])[0],
+        host=public_ip,
         login=FTP_USERNAME,
         password=FTP_PASSWORD,
     )  # create a connection object
 
-    session = settings.Session()
-    for conn in [sftp_conn, ftp_conn]:
-        connection = session.query(Connection).filter_by(conn_id=conn.conn_id).one_or_none()
-        if connection is None:
-            logging.info("Connection %s doesn't exist.", str(conn.conn_id))
-        else:
-            session.delete(connection)
-            session.commit()
-            logging.info("Connection %s deleted.", str(conn.conn_id))
-
-        session.add(conn)
-        session.commit()  # it will insert the connection object programmatically.
-        logging.info("Connection %s is created", conn.conn_id)
+    conn_ids = [sftp_conn.conn_id, ftp_conn.conn_id]
+    with create_session() as session:
+        deleted = (
+            session.query(Connection)
+            .filter(Connection.conn_id.in_(conn_ids))
+            .delete(synchronize_session=False)
+        )
+        logging.info("%s existing connection(s) deleted.", deleted)
+        session.add_all([sftp_conn, ftp_conn])  # it will insert the connection objects programmatically.
+    logging.info("Connections %s are created", conn_ids)
 
 
-def terminate_instance(task_instance: "TaskInstance") -> None:  # noqa: F821
+def terminate_instance(task_instance: TaskInstance) -> None:
     """Terminate ec2 instance by instance id"""
-    import boto3
-
-    ec2 = boto3.client("ec2", **AWS_S3_CREDS)
     ec2_instance_id_xcom = task_instance.xcom_pull(
         key=EC2_INSTANCE_ID_KEY, task_ids=["start_sftp_ftp_services"]
     )[0]
-    ec2.terminate_instances(
+    _ec2_client().terminate_instances(
         InstanceIds=[
             ec2_instance_id_xcom,
         ],
@@ -257,35 +329,9 @@ with DAG(
         python_callable=lambda: time.sleep(30),
     )
 
-    list_installed_pip_packages = BashOperator(
-        task_id="list_installed_pip_packages", bash_command="pip freeze"
-    )
-
-    get_airflow_version = BashOperator(
-        task_id="get_airflow_version", bash_command="airflow version", do_xcom_push=True
-    )
-
-    get_airflow_executor = BashOperator(
-        task_id="get_airflow_executor",
-        bash_command="airflow config get-value core executor",
-        do_xcom_push=True,
-    )
-
-    get_astro_sdk_version = BashOperator(
-        task_id="get_astro_sdk_version",
-        bash_command="pip show astro-sdk-python | grep -i version | awk '{print $2}'",
-        do_xcom_push=True,
-    )
-
-    get_astro_cloud_provider = BashOperator(
-        task_id="get_astro_cloud_provider",
-        bash_command=(
-            "[[ $AIRFLOW__LOGGING__REMOTE_LOG_CONN_ID == *azure* ]] && echo 'azure' ||"
-            "([[ $AIRFLOW__LOGGING__REMOTE_LOG_CONN_ID == *s3* ]] && echo 'aws' ||"
-            "([[ $AIRFLOW__LOGGING__REMOTE_LOG_CONN_ID == *gcs* ]] && echo 'gcs' ||"
-            "echo 'unknown'))"
-        ),
-        do_xcom_push=True,
+    collect_env_details = PythonOperator(
+        task_id="collect_env",
+        python_callable=collect_env,
     )
 
     start_sftp_ftp_services = PythonOperator(
@@ -305,78 +351,69 @@ with DAG(
     dag_run_ids = []
 
     load_file_task_info = [
-        {"example_google_bigquery_gcs_load_and_save": "example_google_bigquery_gcs_load_and_save"},
-        {"example_amazon_s3_postgres_load_and_save": "example_amazon_s3_postgres_load_and_save"},
-        {"example_amazon_s3_postgres": "example_amazon_s3_postgres"},
-        {"example_load_file": "example_load_file"},
+        ("example_google_bigquery_gcs_load_and_save", "example_google_bigquery_gcs_load_and_save"),
+        ("example_amazon_s3_postgres_load_and_save", "example_amazon_s3_postgres_load_and_save"),
+        ("example_amazon_s3_postgres", "example_amazon_s3_postgres"),
+        ("example_load_file", "example_load_file"),
     ]
 
     load_file_trigger_tasks, ids = prepare_dag_dependency(load_file_task_info, "{{ ds }}")
     dag_run_ids.extend(ids)
-    chain(*load_file_trigger_tasks)
 
     transform_task_info = [
-        {"example_amazon_s3_snowflake_transform": "example_amazon_s3_snowflake_transform"},
-        {"example_transform_mssql": "example_transform_mssql"},
+        ("example_amazon_s3_snowflake_transform", "example_amazon_s3_snowflake_transform"),
+        ("example_transform_mssql", "example_transform_mssql"),
     ]
 
     transform_trigger_tasks, ids = prepare_dag_dependency(transform_task_info, "{{ ds }}")
     dag_run_ids.extend(ids)
-    chain(*transform_trigger_tasks)
 
     dataframe_task_info = [
-        {"example_dataframe": "example_dataframe"},
+        ("example_dataframe", "example_dataframe"),
     ]
 
     dataframe_trigger_tasks, ids = prepare_dag_dependency(dataframe_task_info, "{{ ds }}")
     dag_run_ids.extend(ids)
-    chain(*dataframe_trigger_tasks)
 
     append_task_info = [
-        {"example_append": "example_append"},
-        {"example_snowflake_partial_table_with_append": "example_snowflake_partial_table_with_append"},
+        ("example_append", "example_append"),
+        ("example_snowflake_partial_table_with_append", "example_snowflake_partial_table_with_append"),
     ]
 
     append_trigger_tasks, ids = prepare_dag_dependency(append_task_info, "{{ ds }}")
     dag_run_ids.extend(ids)
-    chain(*append_trigger_tasks)
 
-    merge_trigger_tasks = [{"example_merge_bigquery": "example_merge_bigquery"}]
+    merge_trigger_tasks = [("example_merge_bigquery", "example_merge_bigquery")]
 
     merge_trigger_tasks, ids = prepare_dag_dependency(merge_trigger_tasks, "{{ ds }}")
     dag_run_ids.extend(ids)
-    chain(*merge_trigger_tasks)
 
     dynamic_task_info = [
-        {"example_dynamic_map_task": "example_dynamic_map_task"},
-        {"example_dynamic_task_template": "example_dynamic_task_template"},
+        ("example_dynamic_map_task", "example_dynamic_map_task"),
+        ("example_dynamic_task_template", "example_dynamic_task_template"),
     ]
 
     dynamic_task_trigger_tasks, ids = prepare_dag_dependency(dynamic_task_info, "{{ ds }}")
     dag_run_ids.extend(ids)
-    chain(*dynamic_task_trigger_tasks)
 
     data_validation_dags_info = [
-        {"data_validation_check_column": "data_validation_check_column"},
+        ("data_validation_check_column", "data_validation_check_column"),
     ]
 
     data_validation_trigger_tasks, ids = prepare_dag_dependency(data_validation_dags_info, "{{ ds }}")
     dag_run_ids.extend(ids)
-    chain(*data_validation_trigger_tasks)
 
     dataset_dags_info = [
-        {"example_dataset_producer": "example_dataset_producer"},
+        ("example_dataset_producer", "example_dataset_producer"),
     ]
 
     dataset_trigger_tasks, ids = prepare_dag_dependency(dataset_dags_info, "{{ ds }}")
     dag_run_ids.extend(ids)
-    chain(*dataset_trigger_tasks)
 
-    cleanup_snowflake_task_info = [{"example_snowflake_cleanup": "example_snowflake_cleanup"}]
+    cleanup_snowflake_task_info = [("example_snowflake_cleanup", "example_snowflake_cleanup")]
 
     cleanup_snowflake_trigger_tasks, ids = prepare_dag_dependency(cleanup_snowflake_task_info, "{{ ds }}")
     dag_run_ids.extend(ids)
-    chain(*cleanup_snowflake_trigger_tasks)
 
     report = PythonOperator(
         task_id="get_report",
@@ -391,44 +428,31 @@ with DAG(
         trigger_rule="all_success",
     )
 
+    # The example dags are triggered at once rather than one provider group after the other; the number of
+    # them running concurrently is capped by the dag's `max_active_tasks`.
+    trigger_tasks = [
+        *load_file_trigger_tasks,
+        *transform_trigger_tasks,
+        *dataframe_trigger_tasks,
+        *append_trigger_tasks,
+        *merge_trigger_tasks,
+        *dynamic_task_trigger_tasks,
+        *data_validation_trigger_tasks,
+        *dataset_trigger_tasks,
+        *cleanup_snowflake_trigger_tasks,
+    ]
+
     (  # skipcq PYL-W0104
         start
         >> start_sftp_ftp_services
         >> create_sftp_ftp_default_airflow_connection
-        >> [  # skipcq PYL-W0104
-            list_installed_pip_packages,
-            get_airflow_version,
-            get_airflow_executor,
-            get_astro_sdk_version,
-            get_astro_cloud_provider,
-            load_file_trigger_tasks[0],
-            transform_trigger_tasks[0],
-            dataframe_trigger_tasks[0],
-            append_trigger_tasks[0],
-            merge_trigger_tasks[0],
-            dynamic_task_trigger_tasks[0],
-            data_validation_trigger_tasks[0],
-            dataset_trigger_tasks[0],
-            cleanup_snowflake_trigger_tasks[0],
-        ]
+        >> [collect_env_details, *trigger_tasks]  # skipcq PYL-W0104
     )
+    # example_amazon_s3_postgres_load_and_save overwrites the `homes.csv` file of the S3 bucket read by
+    # example_amazon_s3_postgres, so these two still run one after the other.
+    load_file_trigger_tasks[1] >> load_file_trigger_tasks[2]  # skipcq PYL-W0104
 
-    last_task = [
-        list_installed_pip_packages,
-        get_airflow_version,
-        get_airflow_executor,
-        get_astro_sdk_version,
-        get_astro_cloud_provider,
-        load_file_trigger_tasks[-1],
-        transform_trigger_tasks[-1],
-        dataframe_trigger_tasks[-1],
-        append_trigger_tasks[-1],
-        merge_trigger_tasks[-1],
-        dynamic_task_trigger_tasks[-1],
-        data_validation_trigger_tasks[-1],
-        dataset_trigger_tasks[-1],
-        cleanup_snowflake_trigger_tasks[-1],
-    ]
+    last_task = [collect_env_details, *trigger_tasks]
 
     last_task >> end  # skipcq PYL-W0104
     last_task >> report  # skipcq PYL-W0104